@@ -1,12 +1,174 @@
 import os
+import argparse
+import contextlib
+import functools
+import hashlib
+import logging
+import logging.handlers
+import queue
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
 import yt_dlp
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 from yt_dlp.utils import sanitize_filename
 from tqdm import tqdm
-from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, TCON, COMM, APIC
-import requests
+from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB, TDRC, TCON, COMM, APIC
+import urllib3
 import io
 
+logger = logging.getLogger(__name__)
+
+# Playlist items are independent network + ffmpeg jobs, so a handful run at once
+DEFAULT_WORKERS = min(8, os.cpu_count() or 4)
+
+# Removes spaces and tabs in a single pass when comparing artist and title
+STRIP_WHITESPACE = str.maketrans('', '', ' \t')
+
+# Metadata keys and the ID3 text frames they are written to, with any extra frame arguments
+FRAME_MAP = (
+    ('title', TIT2, {}),
+    ('artist', TPE1, {}),
+    ('album', TALB, {}),
+    ('year', TDRC, {}),
+    ('genre', TCON, {}),
+    ('comment', COMM, {'lang': 'eng', 'desc': ''}),
+)
+
+# Largest album art image we are willing to embed
+MAX_THUMBNAIL_BYTES = 2_000_000
+
+# Shared connection pool so album art downloads reuse connections to the thumbnail CDN
+HTTP = urllib3.PoolManager(num_pools=4, maxsize=16, retries=urllib3.Retry(3, backoff_factor=0.3))
+
+# Album art downloads are cached here across runs, keyed by a hash of the URL
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'ytmp3'
+THUMBNAIL_CACHE_DIR = CACHE_DIR / 'thumbs'
+
+# Files tagged by add_metadata_to_existing_files, keyed by (path, size, mtime)
+TAGGED_DB_PATH = CACHE_DIR / 'tagged.db'
+
+# Guards the claimed_names sets shared between concurrent playlist downloads
+CLAIMED_NAMES_LOCK = threading.Lock()
+
+# Per-thread download state: the active progress bar and, in playlist
+# workers, the YoutubeDL instance reused for every video that thread fetches
+download_state = threading.local()
+
+# Album art is prefetched in the background while the audio stream downloads
+THUMBNAIL_POOL = ThreadPoolExecutor(max_workers=16)
+
+# In-flight album art downloads by URL, so tracks sharing a cover wait on one request
+thumbnail_fetches = {}
+THUMBNAIL_FETCHES_LOCK = threading.Lock()
+
+def fetch_thumbnail(url):
+    """
+    Downloads album art and returns the image bytes
+    Concurrent calls for the same URL share one download
+    Raises an exception if the image cannot be downloaded or is too large
+    """
+    with THUMBNAIL_FETCHES_LOCK:
+        future = thumbnail_fetches.get(url)
+        owner = future is None
+        if owner:
+            future = thumbnail_fetches[url] = Future()
+    if not owner:
+        return future.result()
+    
+    try:
+        future.set_result(load_thumbnail(url))
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with THUMBNAIL_FETCHES_LOCK:
+            del thumbnail_fetches[url]
+    return future.result()
+
+@functools.lru_cache(maxsize=128)
+def load_thumbnail(url):
+    """
+    Returns album art bytes from memory, the on-disk cache or the network, in that order
+    Failures raise and so are never cached
+    """
+    cache_path = THUMBNAIL_CACHE_DIR / f"{hashlib.blake2b(url.encode()).hexdigest()}.jpg"
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        pass
+
+    # Stream the body so the image is buffered once and never beyond the size cap
+    response = HTTP.request('GET', url, preload_content=False, timeout=10)
+    try:
+        if response.status >= 400:
+            raise ValueError(f"HTTP {response.status} for {url}")
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if content_length > MAX_THUMBNAIL_BYTES:
+            raise ValueError(f"image is {content_length} bytes")
+        image_data = response.read(MAX_THUMBNAIL_BYTES + 1)
+    except Exception:
+        # Don't hand a connection with an unread body back to the pool
+        response.close()
+        raise
+    finally:
+        response.release_conn()
+    if len(image_data) > MAX_THUMBNAIL_BYTES:
+        raise ValueError(f"image is larger than {MAX_THUMBNAIL_BYTES} bytes")
+
+    # Write to a temporary file first so concurrent readers never see a partial image
+    try:
+        THUMBNAIL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(image_data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Could not cache album art: %s", e)
+    return image_data
+
+def image_mime_type(image_data):
+    """
+    Detects the MIME type of album art from its leading bytes
+    """
+    if image_data.startswith(b'\x89PNG'):
+        return 'image/png'
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
+def id3_padding(info):
+    """
+    Padding policy for ID3 saves: reserve at least 1 KiB after the tag
+    """
+    return max(1024, info.padding)
+
+def tags_up_to_date(tags, frames):
+    """
+    Returns True if every frame in `frames` already has the same text in `tags`
+    """
+    for frame_id, frame in frames.items():
+        existing = tags.getall(frame_id)
+        if not existing or [str(t) for t in existing[0].text] != [str(t) for t in frame.text]:
+            return False
+    return True
+
+def configure_logging(quiet=False):
+    """
+    Sends log records through a queue to a single listener thread that writes to stdout,
+    so worker threads never block on the console
+    Returns the started QueueListener; call stop() on it before exiting to flush pending records
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
 def set_mp3_metadata(file_path, metadata):
     """
     Sets metadata tags on an MP3 file using mutagen
@@ -21,168 +183,262 @@ def set_mp3_metadata(file_path, metadata):
       - genre: Music genre
       - comment: Additional comments
       - thumbnail_url: URL to album art image
+      - thumbnail_bytes: Album art image data, used instead of thumbnail_url
     """
     try:
-        # Create ID3 tag object - create it if doesn't exist
+        # Encode the path once instead of on every open mutagen does
+        fs_path = os.fsencode(file_path)
+        
+        # Load the existing ID3 tag, or start an empty one if the file has none
         try:
-            tags = ID3(file_path)
-        except:
+            tags = ID3(fs_path, v2_version=4)
+        except ID3NoHeaderError:
             tags = ID3()
+            tags.filename = fs_path
         
-        # Set the tags based on provided metadata
-        if 'title' in metadata and metadata['title']:
-            tags['TIT2'] = TIT2(encoding=3, text=metadata['title'])
+        # Build every frame up front, then apply them to the tag in one update
+        frames = {}
+        for key, frame_class, extra_args in FRAME_MAP:
+            value = metadata.get(key)
+            if value:
+                frames[frame_class.__name__] = frame_class(encoding=3, text=str(value), **extra_args)
         
-        if 'artist' in metadata and metadata['artist']:
-            tags['TPE1'] = TPE1(encoding=3, text=metadata['artist'])
-        
-        if 'album' in metadata and metadata['album']:
-            tags['TALB'] = TALB(encoding=3, text=metadata['album'])
-            
-        if 'year' in metadata and metadata['year']:
-            tags['TDRC'] = TDRC(encoding=3, text=str(metadata['year']))
-            
-        if 'genre' in metadata and metadata['genre']:
-            tags['TCON'] = TCON(encoding=3, text=metadata['genre'])
+        wants_art = bool(metadata.get('thumbnail_bytes') or metadata.get('thumbnail_url'))
+        if tags_up_to_date(tags, frames) and (tags.getall('APIC') or not wants_art):
+            logger.info("Metadata already up to date: %s", os.path.basename(file_path))
+            return True
             
-        if 'comment' in metadata and metadata['comment']:
-            tags['COMM'] = COMM(encoding=3, lang='eng', desc='', text=metadata['comment'])
-            
-        # Add album art if URL is provided
-        if 'thumbnail_url' in metadata and metadata['thumbnail_url']:
+        # Add album art if it was prefetched or a URL is provided
+        image_data = metadata.get('thumbnail_bytes')
+        if not image_data and 'thumbnail_url' in metadata and metadata['thumbnail_url']:
             try:
-                response = requests.get(metadata['thumbnail_url'])
-                if response.status_code == 200:
-                    image_data = response.content
-                    tags['APIC'] = APIC(
-                        encoding=3,
-                        mime='image/jpeg',
-                        type=3,  # Cover image
-                        desc='Cover',
-                        data=image_data
-                    )
+                image_data = fetch_thumbnail(metadata['thumbnail_url'])
             except Exception as e:
-                print(f"Failed to add album art: {e}")
+                logger.warning("Failed to add album art: %s", e)
+        
+        if image_data:
+            frames['APIC'] = APIC(
+                encoding=3,
+                mime=image_mime_type(image_data),
+                type=3,  # Cover image
+                desc='Cover',
+                data=image_data
+            )
         
-        # Save the tags to the file
-        tags.save(file_path)
-        print(f"Metadata added to: {os.path.basename(file_path)}")
+        tags.update(frames)
+        
+        # Save the tags to the file, keeping at least 1 KiB of padding so later
+        # edits can grow the tag in place instead of rewriting the audio data
+        tags.save(fs_path, v2_version=4, padding=id3_padding)
+        logger.info("Metadata added to: %s", os.path.basename(file_path))
         return True
     except Exception as e:
-        print(f"Error setting metadata for {file_path}: {str(e)}")
+        logger.error("Error setting metadata for %s: %s", file_path, e)
         return False
 
-def download_youtube_audio(url, output_path='./downloaded-mp3'):
+def download_progress_hook(d):
     """
-    Downloads YouTube audio and converts to MP3
-    Only adds artist name when not already in title
-    Also adds metadata to the MP3 file
+    yt-dlp progress hook that drives the current thread's download bar by raw byte counts
     """
-    Path(output_path).mkdir(parents=True, exist_ok=True)
+    progress = getattr(download_state, 'progress', None)
+    if progress is None:
+        return
     
-    # Custom progress bar hook
-    def my_hook(d):
-        if d['status'] == 'downloading':
-            if 'total_bytes_estimate' in d and d['total_bytes_estimate'] > 0:
-                # Calculate percentage based on downloaded bytes and total estimated bytes
-                percentage = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
-                # Update progress bar to the calculated percentage
-                progress.update(percentage - progress.n)
-                
-            if '_speed_str' in d:
-                progress.set_postfix({"Speed": d['_speed_str']})
-                
-        elif d['status'] == 'finished':
-            # When download finishes, ensure bar is at 100%
-            progress.update(100 - progress.n)
-
-    # First extract info without downloading
-    with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
-        info = ydl.extract_info(url, download=False)
-        
-        # Extract all available metadata
-        artist = info.get('uploader', '') or info.get('artist', '')
-        title = info.get('title', '')
-        album = info.get('album', '') or info.get('playlist_title', '') or 'YouTube Music'
-        release_year = info.get('release_year', '') or info.get('upload_date', '')[:4] if info.get('upload_date', '') else ''
-        genre = info.get('genre', '') or info.get('categories', ['Music'])[0] if info.get('categories') else 'Music'
-        description = info.get('description', '')
-        thumbnail_url = info.get('thumbnail', '') if isinstance(info.get('thumbnail', ''), str) else info.get('thumbnails', [{}])[0].get('url', '')
+    if d['status'] == 'downloading':
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        if total and total != progress.total:
+            progress.total = total
+        progress.update(d['downloaded_bytes'] - progress.n)
         
-        # Prepare metadata dictionary
-        metadata = {
-            'title': title,
-            'artist': artist,
-            'album': album,
-            'year': release_year,
-            'genre': genre,
-            'comment': description[:250] if description else '',  # Truncate long descriptions
-            'thumbnail_url': thumbnail_url
-        }
-        
-        # Clean and compare names
-        clean_artist = artist.lower().replace(" ", "")
-        clean_title = title.lower().replace(" ", "")
-        
-        # Check if artist name appears in title (fuzzy match)
-        artist_in_title = (
-            clean_artist in clean_title or 
-            any(part in clean_title for part in clean_artist.split())
-        )
-
-        # Handle common title patterns
-        if " - " in title and not artist_in_title:
-            base = f"{artist} - {title}"
-        elif artist_in_title:
-            base = title
-        else:
-            base = f"{artist} - {title}"
+        # Throttle speed updates to 4 Hz since each one redraws the bar
+        now = time.monotonic()
+        if '_speed_str' in d and now - download_state.last_postfix > 0.25:
+            download_state.last_postfix = now
+            progress.set_postfix({"Speed": d['_speed_str']}, refresh=False)
+            
+    elif d['status'] == 'finished':
+        # When download finishes, ensure bar is full
+        downloaded = d.get('downloaded_bytes') or d.get('total_bytes') or progress.n
+        progress.total = downloaded
+        progress.update(downloaded - progress.n)
 
-        # Sanitize filename and replace underscores with hyphens
-        sanitized_base = sanitize_filename(base, restricted=True)
-        sanitized_base = sanitized_base.replace('_', ' ')
-        final_filename = f"{sanitized_base}.mp3"
-        outtmpl = os.path.join(output_path, f"{sanitized_base}.%(ext)s")
+# No postprocessors here: conversion happens in convert_to_mp3 so it can
+# overlap with the next download
+YDL_OPTS = {
+    'format': 'bestaudio/best',
+    'noplaylist': True,  # A watch URL with a list= parameter means just that video
+    'quiet': True,
+    'no_warnings': True,
+    'noprogress': True,  # Our tqdm bar replaces yt-dlp's progress line
+    'progress_hooks': [download_progress_hook],
+    # Request additional metadata
+    'writethumbnail': False,  # We'll handle thumbnail separately
+    'writeinfojson': False,   # We don't need the info JSON
+}
 
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'outtmpl': outtmpl,
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'mp3',
-            'preferredquality': '192',
-        }],
-        'quiet': True,
-        'no_warnings': True,
-        'progress_hooks': [my_hook],
-        # Request additional metadata
-        'writethumbnail': False,  # We'll handle thumbnail separately
-        'writeinfojson': False,   # We don't need the info JSON
-    }
+def create_downloader():
+    """
+    Creates a YoutubeDL configured for fetch_youtube_audio
+    YoutubeDL keeps and mutates the params dict it is given, so each gets its own copy
+    """
+    return yt_dlp.YoutubeDL(dict(YDL_OPTS))
+
+def claim_filename(sanitized_base, claimed_names):
+    """
+    Reserves a file name in claimed_names, adding a " (2)", " (3)", ... suffix
+    when another download in the same batch already took it
+    """
+    with CLAIMED_NAMES_LOCK:
+        name = sanitized_base
+        suffix = 2
+        while name.lower() in claimed_names:
+            name = f"{sanitized_base} ({suffix})"
+            suffix += 1
+        claimed_names.add(name.lower())
+    return name
+
+def fetch_youtube_audio(url, output_path='./downloaded-mp3', ydl=None, claimed_names=None):
+    """
+    Downloads the best available YouTube audio stream without converting it
+    Only adds artist name when not already in title
+    Pass a YoutubeDL from create_downloader as `ydl` to reuse its extractor caches
+    across calls; it must not be shared between threads
+    Pass a set shared by concurrent downloads into the same folder as `claimed_names`
+    so two videos with the same name don't write to the same file
+
+    Returns a (downloaded_path, mp3_path, metadata) tuple, or None on failure
+    """
+    Path(output_path).mkdir(parents=True, exist_ok=True)
 
     try:
-        # Initialize progress bar
-        print(f"Downloading: {title}")
-        with tqdm(total=100, unit='%', desc="Downloading", ncols=80) as progress:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+        # A single YoutubeDL instance extracts the info once and then downloads
+        # from that same info dict instead of extracting it again
+        with contextlib.nullcontext(ydl) if ydl else create_downloader() as ydl:
+            info = ydl.extract_info(url, download=False)
+            
+            # Channels, albums and other sets need download_youtube_playlist; downloading
+            # them here would write every entry to the single file name built below
+            if info.get('_type') == 'playlist':
+                logger.error("Error downloading %s: URL is a playlist, not a single video", url)
+                return None
+            
+            # Extract all available metadata
+            artist = info.get('uploader') or info.get('artist') or ''
+            title = info.get('title') or ''
+            album = info.get('album') or info.get('playlist_title') or 'YouTube Music'
+            upload_date = info.get('upload_date') or ''
+            categories = info.get('categories') or ['Music']
+            release_year = info.get('release_year') or (upload_date[:4] if upload_date else '')
+            genre = info.get('genre') or categories[0]
+            description = info.get('description') or ''
+            thumbnail = info.get('thumbnail')
+            if isinstance(thumbnail, str):
+                thumbnail_url = thumbnail
+            else:
+                thumbnails = info.get('thumbnails') or [{}]
+                thumbnail_url = thumbnails[-1].get('url') or ''
+            
+            # Prepare metadata dictionary
+            metadata = {
+                'title': title,
+                'artist': artist,
+                'album': album,
+                'year': release_year,
+                'genre': genre,
+                'comment': description[:250] if description else '',  # Truncate long descriptions
+                'thumbnail_url': thumbnail_url
+            }
+            
+            # Clean and compare names
+            clean_artist = artist.lower().translate(STRIP_WHITESPACE)
+            clean_title = title.lower().translate(STRIP_WHITESPACE)
             
-        # Full path to the downloaded file
+            # Check if artist name appears in title (fuzzy match)
+            artist_in_title = clean_artist in clean_title
+
+            # Handle common title patterns
+            if " - " in title and not artist_in_title:
+                base = f"{artist} - {title}"
+            elif artist_in_title:
+                base = title
+            else:
+                base = f"{artist} - {title}"
+
+            # Sanitize filename and replace underscores with hyphens
+            sanitized_base = sanitize_filename(base, restricted=True)
+            sanitized_base = sanitized_base.replace('_', ' ')
+            if claimed_names is not None:
+                sanitized_base = claim_filename(sanitized_base, claimed_names)
+            final_filename = f"{sanitized_base}.mp3"
+            ydl.params['outtmpl']['default'] = os.path.join(output_path, f"{sanitized_base}.%(ext)s")
+
+            # Initialize progress bar
+            logger.info("Downloading: %s", title)
+            thumbnail_future = THUMBNAIL_POOL.submit(fetch_thumbnail, thumbnail_url) if thumbnail_url else None
+            with tqdm(total=None, unit='B', unit_scale=True, unit_divisor=1024, desc="Downloading",
+                      ncols=80, mininterval=0.2, maxinterval=1.0) as progress:
+                download_state.progress = progress
+                download_state.last_postfix = 0.0
+                try:
+                    result = ydl.process_ie_result(info, download=True)
+                finally:
+                    download_state.progress = None
+
+        if thumbnail_future is not None:
+            try:
+                metadata['thumbnail_bytes'] = thumbnail_future.result()
+            except Exception as e:
+                logger.warning("Failed to prefetch album art: %s", e)
+
+        # Full paths to the downloaded stream and the final MP3
+        downloaded_path = result['requested_downloads'][0]['filepath']
         mp3_path = os.path.join(output_path, final_filename)
-        
+        return downloaded_path, mp3_path, metadata
+    except Exception as e:
+        logger.error("Error downloading %s: %s", url, e)
+        return None
+
+def convert_to_mp3(downloaded_path, mp3_path, metadata):
+    """
+    Converts a downloaded audio stream to a 192k MP3 with ffmpeg
+    and adds metadata to the resulting file
+    """
+    try:
+        if os.path.abspath(downloaded_path) != os.path.abspath(mp3_path):
+            subprocess.run(
+                ['ffmpeg', '-y', '-nostdin', '-loglevel', 'error', '-i', downloaded_path,
+                 '-vn', '-codec:a', 'libmp3lame', '-b:a', '192k', mp3_path],
+                stdin=subprocess.DEVNULL,  # Keep concurrent ffmpeg runs off the interactive terminal
+                check=True,
+            )
+            os.remove(downloaded_path)
+
         # Set metadata tags on the MP3 file
-        print("Adding metadata to MP3 file...")
+        logger.info("Adding metadata to MP3 file...")
         set_mp3_metadata(mp3_path, metadata)
-            
-        print(f"Success: {final_filename}")
+
+        logger.info("Success: %s", os.path.basename(mp3_path))
         return True
     except Exception as e:
-        print(f"Error downloading {url}: {str(e)}")
+        logger.error("Error converting %s: %s", downloaded_path, e)
         return False
 
-def download_youtube_playlist(playlist_url, output_path='./downloaded-mp3'):
+def download_youtube_audio(url, output_path='./downloaded-mp3'):
+    """
+    Downloads YouTube audio and converts to MP3
+    Only adds artist name when not already in title
+    Also adds metadata to the MP3 file
+    """
+    fetched = fetch_youtube_audio(url, output_path)
+    if fetched is None:
+        return False
+    return convert_to_mp3(*fetched)
+
+def download_youtube_playlist(playlist_url, output_path='./downloaded-mp3', workers=DEFAULT_WORKERS):
     """
     Downloads all videos from a YouTube playlist and converts them to MP3
+    Videos are downloaded concurrently using up to `workers` threads, and each
+    one is converted to MP3 while the remaining downloads continue
     """
     Path(output_path).mkdir(parents=True, exist_ok=True)
 
@@ -200,12 +456,12 @@ def download_youtube_playlist(playlist_url, output_path='./downloaded-mp3'):
             playlist_info = ydl.extract_info(playlist_url, download=False)
             
             if not playlist_info or 'entries' not in playlist_info or not playlist_info['entries']:
-                print(f"Error: Could not find videos in the playlist {playlist_url}")
+                logger.error("Error: Could not find videos in the playlist %s", playlist_url)
                 return False
                 
             total_videos = len(playlist_info['entries'])
             playlist_title = playlist_info.get('title', 'YouTube Playlist')
-            print(f"Found {total_videos} videos in playlist: {playlist_title}")
+            logger.info("Found %d videos in playlist: %s", total_videos, playlist_title)
             
             # Create a subfolder for the playlist with a sanitized name
             playlist_folder = sanitize_filename(playlist_title, restricted=True)
@@ -213,126 +469,279 @@ def download_youtube_playlist(playlist_url, output_path='./downloaded-mp3'):
             playlist_path = os.path.join(output_path, playlist_folder)
             Path(playlist_path).mkdir(exist_ok=True)
             
+            # Each fetch worker keeps one YoutubeDL for all of its videos so the
+            # extractor's player and signature caches stay warm between items
+            downloaders = []
+            def start_fetch_worker():
+                download_state.ydl = create_downloader()
+                downloaders.append(download_state.ydl)
+            
+            # Videos that sanitize to the same name would otherwise share one output file
+            claimed_names = set()
+            def fetch_in_worker(video_url):
+                return fetch_youtube_audio(video_url, playlist_path, ydl=download_state.ydl,
+                                           claimed_names=claimed_names)
+            
             # Download each video in the playlist with a progress bar
             successful = 0
-            with tqdm(total=total_videos, unit='videos', desc="Playlist progress", position=0, leave=True) as pbar:
-                for i, entry in enumerate(playlist_info['entries'], 1):
-                    if entry is None:
-                        continue
-                    
-                    # Handle different entry formats based on extraction method
-                    if 'url' in entry:
-                        video_url = entry['url']
-                        if not video_url.startswith('http'):
-                            video_url = f"https://www.youtube.com/watch?v={video_url}"
-                    elif 'id' in entry:
-                        video_url = f"https://www.youtube.com/watch?v={entry['id']}"
-                    else:
-                        print(f"Skipping entry {i}: Could not extract video URL")
-                        pbar.update(1)
-                        continue
+            try:
+                with tqdm(total=total_videos, unit='videos', desc="Playlist progress", position=0, leave=True) as pbar:
+                    with ThreadPoolExecutor(max_workers=max(1, workers), initializer=start_fetch_worker) as fetch_pool, \
+                            ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as convert_pool:
+                        try:
+                            fetches = []
+                            for i, entry in enumerate(playlist_info['entries'], 1):
+                                if entry is None:
+                                    pbar.update(1)
+                                    continue
                         
-                    title = entry.get('title', 'Untitled')
-                    print(f"\n[{i}/{total_videos}] Processing: {title}")
+                                # Handle different entry formats based on extraction method
+                                if 'url' in entry:
+                                    video_url = entry['url']
+                                    if not video_url.startswith('http'):
+                                        video_url = f"https://www.youtube.com/watch?v={video_url}"
+                                elif 'id' in entry:
+                                    video_url = f"https://www.youtube.com/watch?v={entry['id']}"
+                                else:
+                                    logger.warning("Skipping entry %d: Could not extract video URL", i)
+                                    pbar.update(1)
+                                    continue
+                            
+                                title = entry.get('title', 'Untitled')
+                                logger.info("[%d/%d] Processing: %s", i, total_videos, title)
+                                fetches.append(fetch_pool.submit(fetch_in_worker, video_url))
                     
-                    if download_youtube_audio(video_url, playlist_path):
-                        successful += 1
+                            # Hand each finished download straight to the ffmpeg pool
+                            conversions = []
+                            for future in as_completed(fetches):
+                                fetched = future.result()
+                                if fetched is None:
+                                    pbar.update(1)
+                                    continue
+                                conversions.append(convert_pool.submit(convert_to_mp3, *fetched))
                     
-                    pbar.update(1)
+                            for future in as_completed(conversions):
+                                if future.result():
+                                    successful += 1
+                                pbar.update(1)
+                        except BaseException:
+                            # Drop queued videos so Ctrl-C or an error stops the playlist instead
+                            # of waiting for every remaining download and conversion
+                            fetch_pool.shutdown(wait=False, cancel_futures=True)
+                            convert_pool.shutdown(wait=False, cancel_futures=True)
+                            raise
+            finally:
+                for downloader in downloaders:
+                    downloader.close()
                     
-            print(f"\nPlaylist download complete: {successful}/{total_videos} videos were successfully downloaded to '{playlist_path}'")
+            logger.info("Playlist download complete: %d/%d videos were successfully downloaded to '%s'", successful, total_videos, playlist_path)
             return successful > 0
             
         except Exception as e:
-            print(f"Error processing playlist {playlist_url}: {str(e)}")
+            logger.error("Error processing playlist %s: %s", playlist_url, e)
             return False
 
 def is_playlist(url):
     """
-    Check if the URL is a playlist by looking for common playlist identifiers
+    Check if the URL is a playlist from its path and query string, without contacting YouTube
+    YouTube Mix lists (list=RD...) are auto-generated and open-ended, so a video
+    opened from a Mix is treated as a single video
     """
-    return 'playlist' in url.lower() or '&list=' in url or '?list=' in url
+    parsed = urlparse(url.strip())
+    if parsed.path.rstrip('/').endswith('/playlist'):
+        return True
+    
+    list_id = parse_qs(parsed.query).get('list', [''])[0]
+    return bool(list_id) and not list_id.startswith('RD')
+
+def is_video_url(url):
+    """
+    Check if the URL clearly points at a single YouTube video, without contacting YouTube
+    """
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower().split(':')[0]
+    path = parsed.path.rstrip('/')
+    if host == 'youtu.be':
+        return bool(path.strip('/'))
+    if host == 'youtube.com' or host.endswith('.youtube.com'):
+        if path == '/watch':
+            return bool(parse_qs(parsed.query).get('v'))
+        return path.startswith(('/shorts/', '/live/', '/embed/'))
+    return False
+
+def iter_mp3s(root):
+    """
+    Recursively yields the paths of MP3 files under root
+    Uses os.scandir so file types come from the directory listing without extra stat calls
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_mp3s(entry.path)
+                elif entry.name.lower().endswith('.mp3'):
+                    yield entry.path
+    except OSError as e:
+        logger.warning("Skipping %s: %s", root, e)
+
+def open_tagged_index(db_path=TAGGED_DB_PATH):
+    """
+    Opens the sqlite index of already tagged files, creating it if needed
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    index = sqlite3.connect(db_path)
+    index.execute('CREATE TABLE IF NOT EXISTS tagged (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)')
+    return index
+
+def record_tagged(index, file_path):
+    """
+    Records a freshly tagged file in the index
+    Returns the index, or None if it could not be written and should no longer be used
+    """
+    try:
+        stat = os.stat(file_path)
+        index.execute('INSERT OR REPLACE INTO tagged (path, size, mtime_ns) VALUES (?, ?, ?)',
+                      (file_path, stat.st_size, stat.st_mtime_ns))
+        return index
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not update tagged file index: %s", e)
+        index.close()
+        return None
 
 def add_metadata_to_existing_files(directory):
     """
     Process existing MP3 files in a directory to add/update metadata
     based on their filenames
+    Files are tagged concurrently since each one is independent file I/O
+    Files unchanged since they were last tagged are skipped
     """
-    print(f"Processing existing MP3 files in: {directory}")
+    logger.info("Processing existing MP3 files in: %s", directory)
     processed = 0
     failed = 0
+    skipped = 0
     
-    for root, _, files in os.walk(directory):
-        mp3_files = [f for f in files if f.lower().endswith('.mp3')]
-        if not mp3_files:
-            continue
+    # The index only lets unchanged files be skipped, so tag everything without it if unavailable
+    try:
+        index = open_tagged_index()
+        tagged = {path: (size, mtime_ns) for path, size, mtime_ns
+                  in index.execute('SELECT path, size, mtime_ns FROM tagged')}
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Tagged file index unavailable, processing all files: %s", e)
+        index = None
+        tagged = {}
+    
+    # Collect every file and its metadata first, then tag them in parallel
+    jobs = []
+    # Resolve the directory once; paths yielded under it are then already absolute
+    for file_path in iter_mp3s(os.path.abspath(directory)):
+        try:
+            stat = os.stat(file_path)
+            if tagged.get(file_path) == (stat.st_size, stat.st_mtime_ns):
+                skipped += 1
+                continue
             
-        print(f"Found {len(mp3_files)} MP3 files in {root}")
-        
-        for mp3_file in mp3_files:
-            try:
-                file_path = os.path.join(root, mp3_file)
-                print(f"Processing: {mp3_file}")
-                
-                # Extract artist and title from filename
-                filename_without_ext = os.path.splitext(mp3_file)[0]
-                
-                # Try to split by " - " first
-                parts = filename_without_ext.split(" - ", 1)
-                
-                if len(parts) > 1:
-                    artist = parts[0].strip()
-                    title = parts[1].strip()
-                else:
-                    # If no separator, use the filename as title and folder name as artist
-                    title = filename_without_ext.strip()
-                    artist = os.path.basename(root)
-                
-                # Get album from parent folder name
-                album = os.path.basename(root)
-                
-                # Create metadata dictionary
-                metadata = {
-                    'title': title,
-                    'artist': artist,
-                    'album': album,
-                    'genre': 'Music',  # Default genre
-                }
+            root, mp3_file = os.path.split(file_path)
+            folder_name = os.path.basename(root)
+            
+            # Extract artist and title from filename
+            filename_without_ext = os.path.splitext(mp3_file)[0]
+            
+            # Try to split by " - " first
+            parts = filename_without_ext.split(" - ", 1)
+            
+            if len(parts) > 1:
+                artist = parts[0].strip()
+                title = parts[1].strip()
+            else:
+                # If no separator, use the filename as title and folder name as artist
+                title = filename_without_ext.strip()
+                artist = folder_name
+            
+            # Get album from parent folder name
+            album = folder_name
+            
+            # Create metadata dictionary
+            metadata = {
+                'title': title,
+                'artist': artist,
+                'album': album,
+                'genre': 'Music',  # Default genre
+            }
+            jobs.append((file_path, metadata))
                 
-                # Set the metadata
-                if set_mp3_metadata(file_path, metadata):
-                    processed += 1
-                else:
-                    failed += 1
-                    
-            except Exception as e:
-                print(f"Error processing {mp3_file}: {str(e)}")
-                failed += 1
+        except Exception as e:
+            logger.error("Error processing %s: %s", file_path, e)
+            failed += 1
+    
+    logger.info("Found %d MP3 files", len(jobs) + skipped)
+    
+    # Tagging is dominated by file I/O, so threads overlap well without pickling ID3 objects
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(set_mp3_metadata, file_path, metadata): file_path
+                       for file_path, metadata in jobs}
+            try:
+                for future in tqdm(as_completed(futures), total=len(futures), unit='files', desc="Tagging"):
+                    try:
+                        if future.result():
+                            processed += 1
+                            if index is not None:
+                                index = record_tagged(index, futures[future])
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        logger.error("Error processing %s: %s", os.path.basename(futures[future]), e)
+                        failed += 1
+            except BaseException:
+                # Drop queued files so Ctrl-C stops tagging instead of finishing the whole library
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    finally:
+        # Keep the files tagged so far in the index even if the run was interrupted
+        if index is not None:
+            try:
+                index.commit()
+            except sqlite3.Error as e:
+                logger.warning("Could not save tagged file index: %s", e)
+            index.close()
                 
-    print(f"Metadata processing complete: {processed} successful, {failed} failed")
-    return processed > 0
+    logger.info("Metadata processing complete: %d successful, %d failed, %d unchanged", processed, failed, skipped)
+    return processed > 0 or skipped > 0
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YouTube to MP3 Downloader and Metadata Editor")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of playlist videos to download at once (default: {DEFAULT_WORKERS})")
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help="Only log warnings and errors")
+    args = parser.parse_args()
+    log_listener = configure_logging(args.quiet)
+
+    # Printed directly so the banner is written before the input prompt
     print("YouTube to MP3 Downloader and Metadata Editor")
     
-    url = input("Enter YouTube URL: ")
-
-    # Check if it's a playlist URL before using yt-dlp
-    if is_playlist(url):
-        print("Detected playlist URL. Starting playlist download...")
-        download_youtube_playlist(url)
-    else:
-        # If not clearly a playlist from URL pattern, let's try to check with yt-dlp
-        with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
-            try:
+    try:
+        url = input("Enter YouTube URL: ")
+
+        # Playlist and plain video URLs are recognised from the URL alone; anything else
+        # (channels, albums, other sites) gets a quick unprocessed lookup with yt-dlp
+        if is_playlist(url):
+            playlist = True
+        elif is_video_url(url):
+            playlist = False
+        else:
+            with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
                 info = ydl.extract_info(url, download=False, process=False)
-                
-                # Check if it's a playlist
-                if info.get('_type') == 'playlist':
-                    print("Detected playlist URL. Starting playlist download...")
-                    download_youtube_playlist(url)
-                else:
-                    print("Detected single video URL. Starting download...")
-                    download_youtube_audio(url)
-            except Exception as e:
-                print(f"Error processing URL: {str(e)}")
\ No newline at end of file
+                playlist = info.get('_type') == 'playlist'
+        
+        if playlist:
+            logger.info("Detected playlist URL. Starting playlist download...")
+            download_youtube_playlist(url, workers=args.workers)
+        else:
+            logger.info("Detected single video URL. Starting download...")
+            download_youtube_audio(url)
+    except Exception as e:
+        logger.error("Error processing URL: %s", e)
+    finally:
+        log_listener.stop()